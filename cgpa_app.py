@@ -1,50 +1,181 @@
+import inspect
+import io
+
 import streamlit as st
 import pandas as pd
+import numpy as np
 import altair as alt
 
+from cgpa_core import GP_PAIRS, grade_semester
+
 st.set_page_config(page_title="🎓 SGPA / CGPA Calculator", layout="centered")
 
 # =========================================================
 # Helper functions
 # =========================================================
-def grade_point_and_letter_absolute(total):
-    if total >= 90: return 10, "A"
-    elif total >= 80: return 9, "A-"
-    elif total >= 70: return 8, "B"
-    elif total >= 60: return 7, "B-"
-    elif total >= 50: return 6, "C"
-    elif total >= 45: return 5, "C-"
-    elif total >= 35: return 4, "D"
-    else: return 2, "E"
-
-GP_TO_PERCENT = {10: 90, 9: 80, 8: 70, 7: 60, 6: 50, 5: 45, 4: 35, 2: 0}
-
-def safe_sum(*vals):
-    return sum(v for v in vals if pd.notna(v))
+SEMESTERS = (1, 2, 3)
+# Tab / chart and summary-table labels, built once per script run and
+# shared by the tabs, chart and summary instead of formatted at each use
+_SEM_LABEL = {s: f"Semester {s}" for s in SEMESTERS}
+_SEM_SHORT = {s: f"Sem {s}" for s in SEMESTERS}
+
+# st.fragment (1.37+) / st.experimental_fragment (1.33+) rerun only the
+# decorated block on its own widget events; older releases run it inline.
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda f: f)
+
+# st.rerun arrived in 1.27; requirements still allow 1.23, which only has
+# the experimental spelling. Looked up on each script run (a plain getattr).
+_rerun = getattr(st, "rerun", None) or st.experimental_rerun
+
+# This script is re-executed on every rerun, so the editor probe is kept in
+# st.cache_resource: st.data_editor (1.23+) or the older
+# st.experimental_data_editor, which may not accept num_rows, is resolved
+# once per server process and every later rerun gets the cached answer.
+@st.cache_resource
+def _detect_editor():
+    editor = getattr(st, "data_editor", None) or st.experimental_data_editor
+    try:
+        num_rows = "num_rows" in inspect.signature(editor).parameters
+    except (TypeError, ValueError):
+        num_rows = False
+    return editor, num_rows
+
+_EDITOR, _EDITOR_NUM_ROWS = _detect_editor()
 
 # ---------- Styling helpers (NEW, UI ONLY) ----------
-def style_grade(val):
-    colors = {
-        "A": "#2ecc71", "A-": "#2ecc71",
-        "B": "#27ae60", "B-": "#27ae60",
-        "C": "#f1c40f", "C-": "#f1c40f",
-        "D": "#e67e22",
-        "E": "#e74c3c",
-    }
-    return f"color:{colors.get(val, 'black')}; font-weight:bold;"
-
-def style_result(val):
+# Grade and Result only ever take these values, so the CSS is looked up from
+# prebuilt strings with one Series.map per column instead of a Python styler
+# call per cell.
+_GRADE_COLORS = {
+    "A": "#2ecc71", "A-": "#2ecc71",
+    "B": "#27ae60", "B-": "#27ae60",
+    "C": "#f1c40f", "C-": "#f1c40f",
+    "D": "#e67e22",
+    "E": "#e74c3c",
+}
+_GRADE_CSS = {g: f"color:{c}; font-weight:bold;" for g, c in _GRADE_COLORS.items()}
+_RESULT_CSS = {
+    "✅ PASS": "color:green;font-weight:bold;",
+    "❌ FAIL": "color:red;font-weight:bold;",
+}
+
+def style_results(df):
     return (
-        "color:green;font-weight:bold;"
-        if "PASS" in val
-        else "color:red;font-weight:bold;"
+        df.style
+        .apply(lambda col: col.map(_GRADE_CSS), subset=["Grade"])
+        .apply(lambda col: col.map(_RESULT_CSS), subset=["Result"])
     )
 
+# ---------- Input template ----------
+# Cached per shape; st.cache_data hands every caller its own copy, so the
+# editor can never mutate the cached frame. Columns are created with their
+# final dtypes, so no astype passes follow.
+@st.cache_data
+def _build_template(n, same_weights, normalise):
+    default_data = {
+        "Course Name": [f"Course {i+1}" for i in range(n)],
+        "Units": pd.Categorical([4] * n, categories=[4, 5]),
+        "EC1": np.full(n, np.nan),
+        "EC2": np.full(n, np.nan),
+        "EC3": np.full(n, np.nan),
+    }
+
+    if not same_weights:
+        default_data["W1"] = np.full(n, 30.0)
+        default_data["W2"] = np.full(n, 30.0)
+        default_data["W3"] = np.full(n, 40.0)
+
+    if normalise:
+        default_data["Highest"] = np.full(n, 100.0)
+
+    return pd.DataFrame(default_data)
+
+# ---------- SGPA trend ----------
+# These caches are shared by every session and keyed on users' marks, so
+# they are bounded: only recent result sets are worth keeping.
+@st.cache_data(max_entries=32)
+def _trend_chart(sem_keys, sgpas):
+    chart_data = pd.DataFrame({
+        "Semester": [_SEM_LABEL[s] for s in sem_keys],
+        "SGPA": list(sgpas)
+    })
+
+    return alt.Chart(chart_data).mark_bar(
+        size=50,
+        cornerRadiusTopLeft=6,
+        cornerRadiusTopRight=6
+    ).encode(
+        x=alt.X("Semester", axis=alt.Axis(labelAngle=0)),
+        y=alt.Y("SGPA", scale=alt.Scale(domain=[0, 10])),
+        tooltip=["Semester", "SGPA"]
+    ).properties(title="SGPA Trend")
+
+# ---------- Consolidated summary ----------
+# Both helpers are keyed on results_sig — each semester's input signature,
+# which fully determines its result frame. The underscore-prefixed frames
+# argument is skipped by st.cache_data's hashing, so a cache hit costs one
+# small tuple comparison instead of hashing every result row.
+@st.cache_data(max_entries=32)
+def _transcript(results_sig, _sem_frames):
+    rows = [
+        (sem, *rec)
+        for sem, df in _sem_frames
+        for rec in df.itertuples(index=False, name=None)
+    ]
+    columns = _sem_frames[0][1].columns
+    return pd.DataFrame(rows, columns=("Semester", *columns))
+
+@st.cache_data(max_entries=32)
+def _csv_bytes(results_sig, _sem_frames):
+    # Stream each semester straight into one buffer rather than
+    # materialising the combined frame and a full CSV str alongside it.
+    buf = io.BytesIO()
+    for i, (sem, df) in enumerate(_sem_frames):
+        df.assign(Semester=sem)[["Semester", *df.columns]].to_csv(
+            buf, index=False, header=(i == 0), encoding="utf-8"
+        )
+    return buf.getvalue()
+
+# ---------- Static markup (identical on every rerun) ----------
+_FOOTER_HTML = """
+<div style='border:1px solid #ddd;padding:12px;border-radius:6px;background:#fff;font-size:12px;'>
+<b style='color:red;'>Grade mapping:</b> A=10 | A-=9 | B=8 | B-=7 | C=6 | C-=5 | D=4 | E=2<br>
+<b style='color:red;'>Pass criteria:</b> Min GP ≥ 5 | SGPA ≥ 5.5 | CGPA ≥ 5.5<br>
+<b style='color:red;'>Legend:</b> EC1 = Assignment/Quiz | EC2 = Mid Semester Exam | EC3 = Comprehensive Examination
+</div>
+"""
+
+_CREDIT_HTML = "<p style='text-align:right; color:gray; font-size:11px;'>Developed by <b>Subodh Purohit</b> | Last updated: 1 Jan 2026</p>"
+
+# Rule, grade legend and credit line go out as one markdown element.
+_FOOTER_BLOCK = "---\n" + _FOOTER_HTML + "\n" + _CREDIT_HTML
+
 # =========================================================
 # Session state
 # =========================================================
+# App-owned keys are always created together, so one membership test per
+# rerun covers all of them.
+#   results_version: bumped whenever semester_results changes so derived
+#                    views can be reused
+#   cgpa_num / cgpa_den: running CGPA numerator / denominator over all
+#                        stored semesters
 if "semester_results" not in st.session_state:
-    st.session_state.semester_results = {}
+    st.session_state.update(
+        semester_results={},
+        results_version=0,
+        cgpa_num=0,
+        cgpa_den=0,
+    )
+
+def _semester_order():
+    # Sorted semester keys and their SGPAs, rebuilt only after a result changes
+    cached = st.session_state.get("_sem_order")
+    if cached is None or cached[0] != st.session_state.results_version:
+        results = st.session_state.semester_results
+        keys = tuple(sorted(results))
+        cached = (st.session_state.results_version, keys, tuple(results[s]["sgpa"] for s in keys))
+        st.session_state._sem_order = cached
+    return cached[1], cached[2]
 
 # =========================================================
 # Title
@@ -59,8 +190,8 @@ with st.sidebar:
     st.header("Semester Selection")
     current_sem = st.selectbox(
         "Select semester to Edit",
-        [1, 2, 3],
-        format_func=lambda x: f"Semester {x}"
+        SEMESTERS,
+        format_func=_SEM_LABEL.__getitem__
     )
 
     st.markdown("---")
@@ -96,12 +227,73 @@ with st.sidebar:
     st.markdown("---")
     if st.button("🗑️ Clear All Data", type="primary"):
         st.session_state.semester_results = {}
-        st.rerun()
+        st.session_state.results_version += 1
+        st.session_state.cgpa_num = 0
+        st.session_state.cgpa_den = 0
+        _rerun()
+
+# ---------- Grade projection ----------
+# Runs as a fragment: picking a course or target GP reruns only this
+# expander. global_weights is None when weights are entered per course.
+@_fragment
+def _projection_tool(edited_df, global_weights, normalise):
+    with st.expander("Calculate required marks for a specific course"):
+        # First row position of every distinct name, in table order
+        first_pos = {}
+        for i, name in enumerate(edited_df["Course Name"].to_list()):
+            first_pos.setdefault(name, i)
+        course_opts = list(first_pos)
+        if course_opts:
+            selected_course = st.selectbox("Select Course", course_opts)
+            row = edited_df.iloc[first_pos[selected_course]]
+
+            if global_weights is not None:
+                p_w1, p_w2, p_w3 = global_weights
+            else:
+                p_w1 = row.get("W1", 30.0)
+                p_w2 = row.get("W2", 30.0)
+                p_w3 = row.get("W3", 40.0)
+
+            p_h = float(row.get("Highest", 100.0)) if normalise else 100.0
+            # Same fallback as Compute: a blank (NaN) or non-positive Highest means 100
+            if not p_h > 0:
+                p_h = 100.0
+
+            p_ec = row[["EC1", "EC2", "EC3"]].to_numpy(dtype=np.float64)
+
+            current_raw = float(np.nansum(p_ec))
+
+            gp_idx = st.selectbox(
+                "Target GP",
+                range(len(GP_PAIRS)),
+                format_func=lambda i: str(GP_PAIRS[i][0]),
+                index=2
+            )
+            target_gp, target_percent = GP_PAIRS[gp_idx]
+            target_raw = (target_percent / 100) * p_h
+
+            need = target_raw - current_raw
+
+            # Weight still open = weights of the components left blank
+            p_w = np.array((p_w1, p_w2, p_w3), dtype=np.float64)
+            pending_capacity = float(p_w[np.isnan(p_ec)].sum())
+
+            st.markdown(
+                f"**Current Raw Score:** {current_raw:.2f} &nbsp;|&nbsp; "
+                f"**Required Raw Score:** {target_raw:.2f}"
+            )
+
+            if need <= 0:
+                st.success(f"✅ Target {target_gp} already achieved!")
+            elif need > pending_capacity:
+                st.error(f"❌ Cannot reach {target_gp}.")
+            else:
+                st.info(f"You need **{need:.2f}** more marks.")
 
 # =========================================================
 # Semester Tabs
 # =========================================================
-tabs = st.tabs([f"Semester {i}" for i in range(1, 4)])
+tabs = st.tabs([_SEM_LABEL[i] for i in SEMESTERS])
 
 for sem_idx, tab in enumerate(tabs, start=1):
     with tab:
@@ -109,165 +301,105 @@ for sem_idx, tab in enumerate(tabs, start=1):
         if sem_idx == current_sem:
             st.header(f"Input: Semester {current_sem} Marks")
 
-            default_data = {
-                "Course Name": [f"Course {i+1}" for i in range(num_courses)],
-                "Units": [4] * num_courses,
-                "EC1": [None] * num_courses,
-                "EC2": [None] * num_courses,
-                "EC3": [None] * num_courses,
-            }
-
-            if not same_weights:
-                default_data["W1"] = [30.0] * num_courses
-                default_data["W2"] = [30.0] * num_courses
-                default_data["W3"] = [40.0] * num_courses
-
-            if calc_method == "Normalise from Class Highest":
-                default_data["Highest"] = [100.0] * num_courses
-
-            df_template = pd.DataFrame(default_data)
-
-            df_template["Units"] = df_template["Units"].astype("category")
-            df_template["Units"] = df_template["Units"].cat.set_categories([4, 5])
-
-            numeric_cols = ["EC1", "EC2", "EC3"]
-            if "Highest" in df_template.columns:
-                numeric_cols.append("Highest")
-            if "W1" in df_template.columns:
-                numeric_cols.extend(["W1", "W2", "W3"])
-
-            for col in numeric_cols:
-                df_template[col] = df_template[col].astype("float64")
+            normalise = calc_method == "Normalise from Class Highest"
+            df_template = _build_template(num_courses, same_weights, normalise)
 
+            # The template shape is part of the key: edits recorded against one
+            # shape are never replayed onto another, and the widget state for an
+            # unchanged shape is reused as-is across reruns.
             editor_kwargs = {
                 "data": df_template,
                 "use_container_width": True,
-                "key": f"editor_{current_sem}",
-                "num_rows": "dynamic"
+                "key": f"editor_{current_sem}_{num_courses}_{int(same_weights)}_{int(normalise)}",
             }
-
-            try:
-                edited_df = st.data_editor(**editor_kwargs)
-            except AttributeError:
-                try:
-                    edited_df = st.experimental_data_editor(**editor_kwargs)
-                except Exception:
-                    del editor_kwargs["num_rows"]
-                    edited_df = st.experimental_data_editor(**editor_kwargs)
-            except TypeError:
-                del editor_kwargs["num_rows"]
-                edited_df = st.data_editor(**editor_kwargs)
+            if _EDITOR_NUM_ROWS:
+                editor_kwargs["num_rows"] = "dynamic"
+
+            # Cell edits are batched in a form: the script reruns when marks are
+            # applied or computed, not after every edited cell. The sidebar
+            # weights stay outside it: they only feed the projection tool, which
+            # is a fragment, so changing them should update it right away.
+            with st.form(f"marks_form_{current_sem}"):
+                edited_df = _EDITOR(**editor_kwargs)
+                col_apply, col_calc = st.columns(2)
+                col_apply.form_submit_button("Apply Marks")
+                compute_pressed = col_calc.form_submit_button("Compute Semester Result")
+
+            # Per-course weights: one vectorised check over the whole table,
+            # reporting every offending course together (blank weights included).
+            if not same_weights:
+                w_sum = edited_df[["W1", "W2", "W3"]].to_numpy(dtype=np.float64).sum(axis=1)
+                bad = np.flatnonzero(~(np.abs(w_sum - 100) <= 1e-6))
+                if bad.size:
+                    st.error(
+                        "Weights must sum to 100 for: "
+                        + ", ".join(map(str, edited_df["Course Name"].iloc[bad]))
+                    )
 
             # =====================================================
-            # Grade Projection Tool (UNCHANGED)
+            # Grade Projection Tool
             # =====================================================
             st.markdown("#### 🎯 Grade Projection Tool")
-            with st.expander("Calculate required marks for a specific course"):
-                course_opts = edited_df["Course Name"].unique().tolist()
-                if course_opts:
-                    selected_course = st.selectbox("Select Course", course_opts)
-                    subset = edited_df[edited_df["Course Name"] == selected_course]
-
-                    if not subset.empty:
-                        row = subset.iloc[0]
-
-                        if same_weights:
-                            p_w1, p_w2, p_w3 = gw1, gw2, gw3
-                        else:
-                            p_w1 = row.get("W1", 30.0)
-                            p_w2 = row.get("W2", 30.0)
-                            p_w3 = row.get("W3", 40.0)
-
-                        p_h = row.get("Highest", 100.0) if calc_method == "Normalise from Class Highest" else 100.0
-
-                        p_ec1 = row.get("EC1")
-                        p_ec2 = row.get("EC2")
-                        p_ec3 = row.get("EC3")
-
-                        current_raw = safe_sum(p_ec1, p_ec2, p_ec3)
-
-                        target_gp = st.selectbox("Target GP", list(GP_TO_PERCENT.keys()), index=2)
-                        target_percent = GP_TO_PERCENT[target_gp]
-                        target_raw = (target_percent / 100) * p_h
-
-                        need = target_raw - current_raw
-
-                        pending_capacity = 0
-                        if pd.isna(p_ec1): pending_capacity += p_w1
-                        if pd.isna(p_ec2): pending_capacity += p_w2
-                        if pd.isna(p_ec3): pending_capacity += p_w3
-
-                        col1, col2 = st.columns(2)
-                        col1.metric("Current Raw Score", f"{current_raw:.2f}")
-                        col2.metric("Required Raw Score", f"{target_raw:.2f}")
-
-                        if need <= 0:
-                            st.success(f"✅ Target {target_gp} already achieved!")
-                        elif need > pending_capacity:
-                            st.error(f"❌ Cannot reach {target_gp}.")
-                        else:
-                            st.info(f"You need **{need:.2f}** more marks.")
+            _projection_tool(edited_df, (gw1, gw2, gw3) if same_weights else None, normalise)
 
             st.divider()
 
             # =====================================================
             # Compute Semester Result
             # =====================================================
-            if st.button("Compute Semester Result", key=f"calc_{current_sem}"):
-                rows = []
-                total_gp = 0
-                total_units = 0
-
-                for _, row in edited_df.iterrows():
-                    cname = row["Course Name"]
-                    units = row["Units"] if pd.notna(row["Units"]) else 4
-
-                    ec1 = row.get("EC1", 0)
-                    ec2 = row.get("EC2", 0)
-                    ec3 = row.get("EC3", 0)
-
-                    absolute_total = safe_sum(ec1, ec2, ec3)
-
-                    h_course = row.get("Highest", 100.0) if calc_method == "Normalise from Class Highest" else 100.0
-                    if h_course <= 0:
-                        h_course = 100.0
-
-                    final = (absolute_total / h_course) * 100
-                    gp, grade = grade_point_and_letter_absolute(final)
-
-                    total_gp += gp * units
-                    total_units += units
-
-                    rows.append({
-                        "Course": cname,
-                        "Units": units,
-                        "Total Marks (Absolute)": f"{absolute_total:.2f}",
-                        "Total % (Normalised)": f"{final:.2f}",
+            if compute_pressed:
+                names = edited_df["Course Name"].tolist()
+                units = edited_df["Units"].astype("float64").fillna(4).to_numpy().astype(np.int32)
+                ec = edited_df[["EC1", "EC2", "EC3"]].to_numpy(dtype=np.float64)
+
+                if normalise:
+                    h = edited_df["Highest"].to_numpy(dtype=np.float64)
+                    h = np.where(np.isnan(h) | (h <= 0), 100.0, h)
+                else:
+                    h = np.full(len(units), 100.0)
+
+                # Re-pressing Compute with unchanged marks keeps the stored
+                # result instead of regrading and forcing another rerun.
+                input_sig = (tuple(names), units.tobytes(), ec.tobytes(), h.tobytes())
+                previous = st.session_state.semester_results.get(current_sem)
+                if np.isnan(ec).all():
+                    # Nothing entered yet: grading would only store a column of E grades.
+                    st.warning("Enter at least one EC mark before computing the semester result.")
+                elif previous is None or previous.get("input_sig") != input_sig:
+                    absolute_total, final, gp, letters, total_gp, total_units = grade_semester(ec, h, units)
+
+                    result_df = pd.DataFrame({
+                        "Course": names,
+                        "Units": units.astype(np.int8),
+                        "Total Marks (Absolute)": np.char.mod("%.2f", absolute_total),
+                        "Total % (Normalised)": np.char.mod("%.2f", final),
                         "GP": gp,
-                        "Grade": grade,
-                        "Result": "✅ PASS" if gp >= 5 else "❌ FAIL"
-                    })
-
-                st.session_state.semester_results[current_sem] = {
-                    "df": pd.DataFrame(rows),
-                    "sgpa": total_gp / total_units if total_units else 0,
-                    "total_gp": total_gp,
-                    "total_units": total_units
-                }
-                st.rerun()
+                        "Grade": letters,
+                        "Result": np.where(gp >= 5, "✅ PASS", "❌ FAIL"),
+                    }, copy=False)
+
+                    st.session_state.semester_results[current_sem] = {
+                        "df": result_df,
+                        "sgpa": total_gp / total_units if total_units else 0.0,
+                        "total_gp": total_gp,
+                        "total_units": total_units,
+                        "input_sig": input_sig
+                    }
+                    if previous is not None:
+                        st.session_state.cgpa_num -= previous["total_gp"]
+                        st.session_state.cgpa_den -= previous["total_units"]
+                    st.session_state.cgpa_num += total_gp
+                    st.session_state.cgpa_den += total_units
+                    st.session_state.results_version += 1
+                    _rerun()
 
         if sem_idx in st.session_state.semester_results:
             res = st.session_state.semester_results[sem_idx]
             st.markdown(f"### 📄 Semester {sem_idx} Results")
 
-            styled_df = (
-                res["df"]
-                .style
-                .applymap(style_grade, subset=["Grade"])
-                .applymap(style_result, subset=["Result"])
-            )
+            styled_df = style_results(res["df"])
 
-            st.dataframe(styled_df, use_container_width=True)
+            st.dataframe(styled_df, use_container_width=True, hide_index=True)
 
             sgpa_val = res["sgpa"]
             if sgpa_val >= 5.5:
@@ -289,7 +421,7 @@ st.header("📊 Cumulative Performance")
 completed = st.session_state.semester_results
 
 if len(completed) >= 2:
-    cgpa = sum(v["total_gp"] for v in completed.values()) / sum(v["total_units"] for v in completed.values())
+    cgpa = st.session_state.cgpa_num / st.session_state.cgpa_den if st.session_state.cgpa_den else 0.0
 
     if cgpa >= 5.5:
         st.success(f"## 🏆 CGPA: {cgpa:.2f}")
@@ -298,20 +430,8 @@ if len(completed) >= 2:
     else:
         st.error(f"## CGPA: {cgpa:.2f} — FAIL 😢")
 
-    chart_data = pd.DataFrame({
-        "Semester": [f"Semester {s}" for s in sorted(completed)],
-        "SGPA": [completed[s]["sgpa"] for s in sorted(completed)]
-    })
-
-    chart = alt.Chart(chart_data).mark_bar(
-        size=50,
-        cornerRadiusTopLeft=6,
-        cornerRadiusTopRight=6
-    ).encode(
-        x=alt.X("Semester", axis=alt.Axis(labelAngle=0)),
-        y=alt.Y("SGPA", scale=alt.Scale(domain=[0, 10])),
-        tooltip=["Semester", "SGPA"]
-    ).properties(title="SGPA Trend")
+    sem_keys, sgpas = _semester_order()
+    chart = _trend_chart(sem_keys, sgpas)
 
     st.altair_chart(chart, use_container_width=True)
 
@@ -324,54 +444,40 @@ elif len(completed) > 0:
 st.markdown("---")
 st.subheader("📑 Consolidated Academic Summary")
 
-completed = st.session_state.semester_results
+# Wrapped in a fragment so clicking Download reruns only this block
+@_fragment
+def _consolidated_summary():
+    completed = st.session_state.semester_results
 
-all_rows = []
-for s in sorted(completed.keys()):
-    sem_df = completed[s]["df"].copy()
-    sem_df.insert(0, "Semester", f"Sem {s}")
-    all_rows.append(sem_df)
+    if completed:
+        sem_keys, _ = _semester_order()
+        results_sig = tuple((s, completed[s]["input_sig"]) for s in sem_keys)
+        sem_frames = tuple((_SEM_SHORT[s], completed[s]["df"]) for s in sem_keys)
+        full_df = _transcript(results_sig, sem_frames)
 
-if all_rows:
-    full_df = pd.concat(all_rows, ignore_index=True)
+        # ---- IMPORTANT: set index BEFORE styling ----
+        full_df_indexed = full_df.set_index(["Semester", "Course"])
 
-    # ---- IMPORTANT: set index BEFORE styling ----
-    full_df_indexed = full_df.set_index(["Semester", "Course"])
+        styled_full = style_results(full_df_indexed)
 
-    styled_full = (
-        full_df_indexed
-        .style
-        .applymap(style_grade, subset=["Grade"])
-        .applymap(style_result, subset=["Result"])
-    )
+        st.dataframe(styled_full, use_container_width=True)
+
+        # CSV export must use the ORIGINAL DataFrame
+        csv = _csv_bytes(results_sig, sem_frames)
 
-    st.dataframe(styled_full, use_container_width=True)
+        st.download_button(
+            label="📥 Download Consolidated Summary (CSV)",
+            data=csv,
+            file_name="academic_summary.csv",
+            mime="text/csv",
+        )
+    else:
+        st.info("No semester results available yet.")
 
-    # CSV export must use the ORIGINAL DataFrame
-    csv = full_df.to_csv(index=False).encode("utf-8")
 
-    st.download_button(
-        label="📥 Download Consolidated Summary (CSV)",
-        data=csv,
-        file_name="academic_summary.csv",
-        mime="text/csv",
-    )
-else:
-    st.info("No semester results available yet.")
+_consolidated_summary()
 
 # =========================================================
 # FULL ORIGINAL FOOTER
 # =========================================================
-st.markdown("---")
-st.markdown("""
-<div style='border:1px solid #ddd;padding:12px;border-radius:6px;background:#fff;font-size:12px;'>
-<b style='color:red;'>Grade mapping:</b> A=10 | A-=9 | B=8 | B-=7 | C=6 | C-=5 | D=4 | E=2<br>
-<b style='color:red;'>Pass criteria:</b> Min GP ≥ 5 | SGPA ≥ 5.5 | CGPA ≥ 5.5<br>
-<b style='color:red;'>Legend:</b> EC1 = Assignment/Quiz | EC2 = Mid Semester Exam | EC3 = Comprehensive Examination
-</div>
-""", unsafe_allow_html=True)
-
-st.markdown(
-    "<p style='text-align:right; color:gray; font-size:11px;'>Developed by <b>Subodh Purohit</b> | Last updated: 1 Jan 2026</p>",
-    unsafe_allow_html=True
-)
+st.markdown(_FOOTER_BLOCK, unsafe_allow_html=True)
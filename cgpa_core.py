@@ -0,0 +1,43 @@
+"""Grade tables and pure-numeric helpers shared by the Streamlit UI."""
+
+import numpy as np
+
+# Lower bound (%) of every grade above E, ascending, and the (GP, letter)
+# pair for each band: _GRADES[i] applies when _THRESH[i-1] <= total < _THRESH[i].
+_THRESH = (35, 45, 50, 60, 70, 80, 90)
+_GRADES = ((2, "E"), (4, "D"), (5, "C-"), (6, "C"), (7, "B-"), (8, "B"), (9, "A-"), (10, "A"))
+
+# Array views of the same table for grading a whole semester at once
+_THRESH_ARR = np.array(_THRESH, dtype=np.float64)
+_GP_ARR = np.array([gp for gp, _ in _GRADES], dtype=np.int8)
+_LETTER_ARR = np.array([letter for _, letter in _GRADES], dtype=object)
+# Shared by every session in the server process: freeze them so no caller
+# can corrupt the table in place.
+for _arr in (_THRESH_ARR, _GP_ARR, _LETTER_ARR):
+    _arr.setflags(write=False)
+del _arr
+
+# (target GP, minimum %) in the order offered by the projection tool
+GP_PAIRS = ((10, 90), (9, 80), (8, 70), (7, 60), (6, 50), (5, 45), (4, 35), (2, 0))
+
+
+def grade_point_and_letter_vec(final):
+    idx = np.searchsorted(_THRESH_ARR, final, side="right")
+    # searchsorted sorts NaN past every cutoff; grade it as E, not A
+    idx = np.where(np.isnan(final), 0, idx)
+    return _GP_ARR[idx], _LETTER_ARR[idx]
+
+
+# Pure-numeric SGPA kernel: ec is (n, 3) with NaN for missing marks, h and
+# units are length n. Returns per-course totals, percentages, grade points
+# and letters plus the unit-weighted GP and unit sums.
+def grade_semester(ec, h, units):
+    absolute_total = np.nansum(ec, axis=1)
+    final = absolute_total / h * 100
+    gp, letters = grade_point_and_letter_vec(final)
+    # GP and units are small integers: keep the sums exact and only go to
+    # float when the SGPA is divided out.
+    units = units.astype(np.int32, copy=False)
+    total_gp = int(np.dot(gp.astype(np.int32), units))
+    total_units = int(units.sum())
+    return absolute_total, final, gp, letters, total_gp, total_units